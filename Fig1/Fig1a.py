@@ -6,47 +6,67 @@ Output: Fig1a.png
 
 import os
 import numpy as np
+import matplotlib
+
+INTERACTIVE = os.environ.get('MPL_INTERACTIVE') == '1'
+if not INTERACTIVE:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 from matplotlib.patches import Arc
 import pandas as pd
 
+plt.style.use(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           '..', 'common', 'paper.mplstyle'))
 plt.rcParams.update({
-    "text.usetex": True,
-    "font.family": 'serif',
-    "xtick.direction": 'in',
-    "ytick.direction": 'in',
-    "lines.linewidth": 2.5,
-    "axes.linewidth": 1.5
+    # Labels here are plain $...$ math; mathtext avoids the LaTeX pipeline
+    "text.usetex": False,
+    "mathtext.fontset": 'cm',
 })
-plt.rcParams['text.latex.preamble'] = r'\usepackage{amsmath}'
 
-def load_data(file_path, t):
-    """Load x,y flagella coordinates at time step t from CSV."""
+def load_data(file_path):
+    """Load x,y flagella coordinates from CSV, sorted by time step."""
     df = pd.read_csv(file_path)
-    df_t = df[df["time"] == t]
-    if df_t.empty:
-        raise ValueError(f"No data found at time {t}")
-    x = df_t.iloc[:, 2].values
-    y = df_t.iloc[:, 3].values
-    return x, y
+    df.sort_values("time", kind="stable", inplace=True)
+    times = df["time"].to_numpy(copy=False)
+    xy = df.iloc[:, 2:4].to_numpy(copy=False)
+    return times, xy
+
+# Reversed rainbow RGBA palettes, cached per number of time steps
+_COLOR_CACHE = {}
+
+def _rainbow_r(n):
+    colors = _COLOR_CACHE.get(n)
+    if colors is None:
+        colors = plt.cm.rainbow(np.linspace(1, 0, n))
+        _COLOR_CACHE[n] = colors
+    return colors
+
+# Unit-circle samples for the cell-body outline, computed once per run
+_THETA = np.linspace(0, 2*np.pi, 200)
+_COS_THETA = np.cos(_THETA)
+_SIN_THETA = np.sin(_THETA)
 
 def draw_cell_body(ax, a, b, y_offset):
     """Draw elliptical cell body."""
-    theta = np.linspace(0, 2*np.pi, 200)
-    ax.fill(a*np.cos(theta), b*np.sin(theta) + y_offset, 'lightgray',
+    ax.fill(a*_COS_THETA, b*_SIN_THETA + y_offset, 'lightgray',
             edgecolor='black', linewidth=3)
 
-def draw_flagella(ax, file_path, time_steps):
+def draw_flagella(ax, times, xy, time_steps, rx, ry):
     """Draw flagella trajectories for all time steps."""
-    colors = plt.cm.rainbow(np.linspace(1, 0, len(time_steps)))
-    for t, color in zip(time_steps, colors):
-        x, y = load_data(file_path, t)
-        rx = a * np.cos(phi)
-        ry = b * np.sin(phi) + y_offset
-        lx = -a * np.cos(phi)
-        ly = b * np.sin(phi) + y_offset
-        ax.plot(x + rx, y + ry, color=color, linewidth=3)
-        ax.plot(-x + lx, y + ly, color=color, linewidth=3)
+    colors = _rainbow_r(len(time_steps))
+    lx = -rx
+    ly = ry
+    # Each time step occupies a contiguous range of the sorted rows
+    steps = np.asarray(time_steps)
+    starts = np.searchsorted(times, steps, side='left')
+    ends = np.searchsorted(times, steps, side='right')
+    for k, t in enumerate(time_steps):
+        if starts[k] == ends[k]:
+            raise ValueError(f"No data found at time {t}")
+        x, y = xy[starts[k]:ends[k]].T
+        ax.plot(x + rx, y + ry, color=colors[k], linewidth=3)
+        ax.plot(-x + lx, y + ly, color=colors[k], linewidth=3)
 
 def add_colorbar(fig, time_steps):
     """Add time colorbar to the figure."""
@@ -64,10 +84,16 @@ def plot_cell_with_flagella(file_path, output_name, a, b, phi, y_offset, num_tim
     ax.set_axis_off()
     draw_cell_body(ax, a, b, y_offset)
     time_steps = range(num_time_steps)
-    draw_flagella(ax, file_path, time_steps)
+    times, xy = load_data(file_path)
+    # Flagellum anchor point on the cell body, shared by all time steps
+    rx = a * np.cos(phi)
+    ry = b * np.sin(phi) + y_offset
+    draw_flagella(ax, times, xy, time_steps, rx, ry)
     add_colorbar(fig, time_steps)
-    plt.savefig(output_name, dpi=300, bbox_inches='tight')
-    plt.show()
+    fig.savefig(output_name, dpi=300, bbox_inches='tight',
+                pil_kwargs={'optimize': True, 'compress_level': 6})
+    if INTERACTIVE:
+        plt.show()
 
 if __name__ == '__main__':
     # Get script directory to ensure correct save path
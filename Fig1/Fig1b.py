@@ -4,30 +4,30 @@ Input files: Fig1b.npz
 Output: Fig1b.png
 """
 import numpy as np
+import os
+import matplotlib
+
+INTERACTIVE = os.environ.get('MPL_INTERACTIVE') == '1'
+if not INTERACTIVE:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 from matplotlib.patches import Ellipse
-import os
 
 fontsize = 32
 
+plt.style.use(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           '..', 'common', 'paper.mplstyle'))
 plt.rcParams.update({
-    "text.usetex": True,
-    "font.family": 'serif',
-    "xtick.direction": 'in',
-    "ytick.direction": 'in',
-    "axes.edgecolor": '0.3',
-    "xtick.color": "0.3",
-    "ytick.color": "0.3",
-    "xtick.labelcolor": "black",
-    "ytick.labelcolor": "black",
     "xtick.labelsize": fontsize,
     "ytick.labelsize": fontsize,
     "axes.labelsize": fontsize,
-    "axes.linewidth": 1.5,
-    "xtick.major.width": 1.5,
-    "ytick.major.width": 1.5
+    # Labels here are plain $...$ math; mathtext avoids the LaTeX pipeline
+    "text.usetex": False,
+    "mathtext.fontset": 'cm',
+    # Chunk the dense flow-field paths for faster Agg rendering
+    "agg.path.chunksize": 10000,
 })
-plt.rcParams['text.latex.preamble'] = r'\usepackage{amsmath}'
 
 def load_data(data_path):
     """Load flow field data from npz file."""
@@ -41,19 +41,39 @@ def plot_flow_field(data, output_path, a, b, axis_range, axis_ticks):
     """Plot flow field with velocity contour and streamlines."""
     X, Y = data['X_plot'], data['Y_plot']
     U, V = data['U_plot'], data['V_plot']
+
+    # Coarsen oversampled grids before plotting; the figure DPI cannot
+    # resolve more than a few hundred cells per side anyway.
+    sy = max(1, X.shape[0] // 300)
+    sx = max(1, X.shape[1] // 300)
+    X, Y, U, V = X[::sy, ::sx], Y[::sy, ::sx], U[::sy, ::sx], V[::sy, ::sx]
     speed = calculate_speed(U, V)
 
+    # The streamline tracer tolerates an even coarser grid
+    if sy > 1 or sx > 1:
+        Xs, Ys, Us, Vs = X[::2, ::2], Y[::2, ::2], U[::2, ::2], V[::2, ::2]
+    else:
+        Xs, Ys, Us, Vs = X, Y, U, V
+
     fig, ax = plt.subplots(figsize=(7.5, 7.5))
-    contour = ax.contourf(X, Y, speed, levels=200, cmap='jet', alpha=1.0, zorder=1)
-    ax.streamplot(X, Y, U, V, 
-                  color="darkgray",
-                  linewidth=1.8,
-                  density=[0.4, 0.38],
-                  arrowsize=3,
-                  arrowstyle='->',
-                  minlength=0.1,
-                  maxlength=5.8,
-                  broken_streamlines=False)
+    # pcolormesh renders the smooth speed field much faster than 200-level
+    # contourf; the speed is NaN inside the cell body, so take nanmax
+    contour = ax.pcolormesh(X, Y, speed, cmap='jet', shading='gouraud',
+                            vmin=0, vmax=np.nanmax(speed), zorder=1)
+    sp = ax.streamplot(Xs, Ys, Us, Vs,
+                       color="darkgray",
+                       linewidth=1.8,
+                       density=[0.4, 0.38],
+                       arrowsize=3,
+                       arrowstyle='->',
+                       minlength=0.1,
+                       maxlength=5.8,
+                       broken_streamlines=False)
+
+    # Rasterize the speed field, streamlines and their arrows into one bitmap
+    # layer at save time; the ellipse (zorder=10) and axes stay vector.
+    sp.lines.set_rasterized(True)
+    ax.set_rasterization_zorder(5)
 
     ellipse = Ellipse((0, 0), width=2*a, height=2*b, edgecolor='black', facecolor='lightgray', linewidth=5, zorder=10)
     ax.add_patch(ellipse)
@@ -71,8 +91,10 @@ def plot_flow_field(data, output_path, a, b, axis_range, axis_ticks):
     cbar.ax.text(0.85, 1.02, r'$U/U_0$', transform=cbar.ax.transAxes,
                   fontsize=30, ha='center', va='bottom')
 
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.show()
+    fig.savefig(output_path, dpi=300, bbox_inches='tight',
+                pil_kwargs={'optimize': True, 'compress_level': 6})
+    if INTERACTIVE:
+        plt.show()
 
 if __name__ == '__main__':
     # Get script directory to ensure correct save path
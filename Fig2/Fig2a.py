@@ -17,37 +17,32 @@ Output:
 """
 
 import os
+import numpy as np
 import pandas as pd
+import matplotlib
+
+INTERACTIVE = os.environ.get('MPL_INTERACTIVE') == '1'
+if not INTERACTIVE:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import matplotlib.gridspec as gridspec
 from matplotlib.patches import Patch
 
 fontsize = 24
+plt.style.use(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           '..', 'common', 'paper.mplstyle'))
 plt.rcParams.update({
-    "text.usetex": True,
-    "font.family": 'serif',
-    "xtick.direction": 'in',
-    "ytick.direction": 'in',
-    "axes.edgecolor": '0.3',
-    "xtick.color": "0.3",
-    "ytick.color": "0.3",
-    "xtick.labelcolor": "black",
-    "ytick.labelcolor": "black",
     "xtick.labelsize": fontsize,
     "ytick.labelsize": fontsize,
     "axes.labelsize": fontsize,
     "axes.titlesize": fontsize + 2,
     "legend.fontsize": fontsize - 6,
-    "lines.linewidth": 2.5,
-    "axes.linewidth": 1.5,
-    "xtick.major.width": 1.5,
-    "ytick.major.width": 1.5,
 })
-plt.rcParams['text.latex.preamble'] = r'\usepackage{amsmath}'
 
 def plot_figure(df):
     L = 14
-    b_normalized = df['b'].values / L
+    b_normalized = df['b'].to_numpy(copy=False) / L
     fig = plt.figure(figsize=(8, 5))
     gs = gridspec.GridSpec(1, 2, left=0.1, right=0.95, bottom=0.15, top=0.85, wspace=0.03)
 
@@ -66,11 +61,16 @@ def plot_figure(df):
     y_min, y_max = ax1.get_ylim()
     b_min, b_max = 0.3, 0.46
     n_segments = 100
-    for i in range(n_segments):
-        y_start = y_max - i * (y_max - y_min) / n_segments
-        y_end = y_max - (i + 1) * (y_max - y_min) / n_segments
-        alpha = 0.05 + 0.4 * (i / n_segments)
-        ax1.add_patch(plt.Rectangle((b_min, y_end), b_max - b_min, y_start - y_end, facecolor='gray', alpha=alpha, edgecolor='none', linewidth=0, zorder=0))
+    # Vertical gray gradient as a single image instead of n_segments rectangles
+    rgba = np.zeros((n_segments, 1, 4))
+    rgba[..., :3] = 0.5
+    rgba[..., 3] = (0.05 + 0.4 * np.linspace(0, 1, n_segments))[::-1, None]
+    # imshow pins the view to the image extent, so restore the x-limits
+    # afterwards to keep the panel spanning the full data range
+    x_min, x_max = ax1.get_xlim()
+    ax1.imshow(rgba, extent=[b_min, b_max, y_min, y_max], origin='lower',
+               aspect='auto', zorder=0, interpolation='bilinear')
+    ax1.set_xlim(x_min, x_max)
     handles, labels = ax1.get_legend_handles_labels()
     handles = [Patch(facecolor='none', edgecolor='none')] + handles
     labels = [r'$b/a$'] + labels
@@ -78,9 +78,9 @@ def plot_figure(df):
     legend.get_frame().set(edgecolor='none', facecolor='white', alpha=0.9)
 
     ax2 = fig.add_subplot(gs[0, 1])
-    Uy_HIs = df['Uy(HIs)'].values
-    Uy_noffHIs = df['Uy(noffHIs)'].values
-    Uy_noHIs = df['Uy(noHIs)'].values
+    Uy_HIs = df['Uy(HIs)'].to_numpy(copy=False)
+    Uy_noffHIs = df['Uy(noffHIs)'].to_numpy(copy=False)
+    Uy_noHIs = df['Uy(noHIs)'].to_numpy(copy=False)
     ax2.plot(b_normalized, Uy_HIs, marker='o', markersize=8, markerfacecolor='red', markeredgecolor='black', markeredgewidth=1, color='red', linestyle='-')
     ax2.plot(b_normalized, Uy_noffHIs, marker='o', markersize=8, markerfacecolor='none', markeredgecolor='red', markeredgewidth=2, color='red', linestyle='-', label=r'only body-\par flagella HIs')
     ax2.plot(b_normalized, Uy_noHIs, marker='o', markersize=8, markerfacecolor='none', markeredgecolor='black', markeredgewidth=2, color='black', linestyle='--', label=r'no HIs')
@@ -98,10 +98,15 @@ def main():
     data_file = os.path.join(current_dir, 'Fig2a.csv')
     output_file = os.path.join(current_dir, 'Fig2a.png')
 
-    df = pd.read_csv(data_file)
+    df = pd.read_csv(data_file,
+                     usecols=['b', 'Uy(b/a_1.2)', 'Uy(HIs)', 'Uy(b/a_2.5)',
+                              'Uy(noffHIs)', 'Uy(noHIs)'],
+                     dtype=float, engine='c')
     fig = plot_figure(df)
-    fig.savefig(output_file, dpi=300, bbox_inches='tight')
-    plt.show()
+    fig.savefig(output_file, dpi=300, bbox_inches='tight',
+                pil_kwargs={'optimize': True, 'compress_level': 6})
+    if INTERACTIVE:
+        plt.show()
 
 if __name__ == '__main__':
     main()
@@ -13,49 +13,50 @@ Output:
         * Main plot: Ub(t)/U0 vs t/T 
         * Inset plot: ΔUb/U0 vs t/T
 """
-import pandas as pd
-import matplotlib.pyplot as plt
+import numpy as np
 import os
+import matplotlib
+
+INTERACTIVE = os.environ.get('MPL_INTERACTIVE') == '1'
+if not INTERACTIVE:
+    matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
 
 fontsize = 33
+plt.style.use(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           '..', 'common', 'paper.mplstyle'))
 plt.rcParams.update({
-    "text.usetex": True,
-    "font.family": 'serif',
-    "xtick.direction": 'in',
-    "ytick.direction": 'in',
-    "axes.edgecolor": '0.3',
-    "xtick.color": "0.3",
-    "ytick.color": "0.3",
-    "xtick.labelcolor": "black",
-    "ytick.labelcolor": "black",
     "xtick.labelsize": fontsize,
     "ytick.labelsize": fontsize,
     "axes.labelsize": fontsize,
-    "axes.titlesize": fontsize + 2, 
+    "axes.titlesize": fontsize + 2,
     "legend.fontsize": fontsize - 10,
-    "lines.linewidth": 2.5,
-    "axes.linewidth": 1.5,
+    # Prune collinear vertices when rendering the time series
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
 })
-plt.rcParams['text.latex.preamble'] = r'\usepackage{amsmath}'
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 data_file = os.path.join(current_dir, 'Fig3a.csv')
 output_file = os.path.join(current_dir, 'Fig3a.png')
 
-df = pd.read_csv(data_file)
-t = df['t/T'].values
-v_with = df['Ub(with_HIs)'].values
-v_without = df['Ub(no_HIs)'].values
-v_diff = df['delta_Ub'].values
+# Column order: t/T, Ub(with_HIs), Ub(no_HIs), delta_Ub
+t, v_with, v_without, v_diff = np.loadtxt(data_file, delimiter=',', skiprows=1,
+                                          unpack=True)
 
 fig, ax = plt.subplots(figsize=(8, 5))
 ax.set_position([0.15, 0.15, 0.75, 0.75])
 
 ax.axhline(0, color='gray', linestyle=':', linewidth=2, alpha=0.7)
+# Keep the marker count bounded if the time series is ever densified
+markevery = max(1, len(t) // 20)
 ax.plot(t, v_with, color='red', linestyle='-', marker='o', markerfacecolor='red',
-         markeredgecolor='black', markeredgewidth=1, markersize=13, label='with HIs')
+         markeredgecolor='black', markeredgewidth=1, markersize=13,
+         markevery=markevery, label='with HIs')
 ax.plot(t, v_without, color='black', linestyle='--', marker='o', markerfacecolor='none',
-         markeredgecolor='black', markeredgewidth=2, markersize=13, label='no HIs')
+         markeredgecolor='black', markeredgewidth=2, markersize=13,
+         markevery=markevery, label='no HIs')
 
 ax.axvspan(0, 14/27, color='#E74C3C', alpha=0.2)
 ax.axvspan(14/27, 1, color='#3498DB', alpha=0.2)
@@ -88,5 +89,7 @@ ax_inset.set_ylabel(r'$\Delta U_{\mathrm{b}}/U_{0}$', fontsize=20, labelpad=5)
 ax_inset.tick_params(labelsize=18)
 
 plt.tight_layout(pad=0)
-plt.savefig(output_file, dpi=300, bbox_inches='tight')
-plt.show()
\ No newline at end of file
+fig.savefig(output_file, dpi=300, bbox_inches='tight',
+            pil_kwargs={'optimize': True, 'compress_level': 6})
+if INTERACTIVE:
+    plt.show()
\ No newline at end of file
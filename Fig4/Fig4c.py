@@ -14,33 +14,39 @@ Output:
         * Right group: Forces on flagella from body
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
 import numpy as np
 import os
+import matplotlib
+
+INTERACTIVE = os.environ.get('MPL_INTERACTIVE') == '1'
+if not INTERACTIVE:
+    matplotlib.use('Agg')
+
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 
 fontsize = 35.5
+plt.style.use(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                           '..', 'common', 'paper.mplstyle'))
 plt.rcParams.update({
-    "text.usetex": True,
-    "font.family": 'serif',
-    "xtick.labelcolor": "black",
     "xtick.labelsize": fontsize,
 })
-plt.rcParams['text.latex.preamble'] = r'\usepackage{amsmath}'
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 data_file = os.path.join(current_dir, 'Fig4c.csv')
 output_file = os.path.join(current_dir, 'Fig4c.png')
 
-df = pd.read_csv(data_file)
+# genfromtxt strips non-alphanumeric characters from the header names,
+# so the 'Fb(y)' and 'Ff(y)' columns become 'Fby' and 'Ffy'
+arr = np.genfromtxt(data_file, delimiter=',', names=True)
 
-Fb = df['Fb(y)'].abs()
-Ff = df['Ff(y)'].abs()
+Fb = arr['Fby']
+Ff = arr['Ffy']
 
-mean_power1 = Fb[:14].mean()
-mean_recover1 = Fb[14:].mean()
-mean_power2 = Ff[:14].mean()
-mean_recover2 = Ff[14:].mean()
+mean_power1 = np.abs(Fb[:14]).mean()
+mean_recover1 = np.abs(Fb[14:]).mean()
+mean_power2 = np.abs(Ff[:14]).mean()
+mean_recover2 = np.abs(Ff[14:]).mean()
 
 fig, ax = plt.subplots(figsize=(7.6, 5)) 
 ax.set_position([0.15, 0.15, 0.75, 0.75])
@@ -74,12 +80,17 @@ ax.axhline(y=0, color='black', linewidth=1.5, zorder=1)
 ax.plot([0, 0], [0, y_max * 1.05], 'k-', linewidth=1.2, zorder=1)
 
 y_ticks = np.arange(0, y_max, 0.5)
-y_ticks = y_ticks[y_ticks <= y_max]
+y_ticks = y_ticks[(y_ticks <= y_max) & (y_ticks > 0)]
+
+# One LineCollection covers all hand-drawn tick marks
+tick_segments = np.stack([np.column_stack([np.zeros_like(y_ticks), y_ticks]),
+                          np.column_stack([np.full_like(y_ticks, 0.06), y_ticks])],
+                         axis=1)
+ax.add_collection(LineCollection(tick_segments, colors='k', linewidths=1.0, zorder=2))
 
-for y in y_ticks:
-    if y > 0:
-        ax.plot([0, 0.06], [y, y], 'k-', linewidth=1.0, zorder=2)
-        ax.text(-0.08, y, f'{y:.1f}', ha='right', va='center', fontsize=fontsize-1)
+tick_labels = [f'{y:.1f}' for y in y_ticks]
+for y, label in zip(y_ticks, tick_labels):
+    ax.text(-0.08, y, label, ha='right', va='center', fontsize=fontsize-1)
 
 label_y = y_max * 0.95
 
@@ -92,5 +103,7 @@ ax.text(group_spacing, label_y,
         ha='center', va='center', fontsize=fontsize-5, weight='bold')
 
 plt.tight_layout(pad=0)
-plt.savefig(output_file, dpi=300, bbox_inches='tight')
-plt.show()
\ No newline at end of file
+fig.savefig(output_file, dpi=300, bbox_inches='tight',
+            pil_kwargs={'optimize': True, 'compress_level': 6})
+if INTERACTIVE:
+    plt.show()
\ No newline at end of file
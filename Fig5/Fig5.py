@@ -17,9 +17,15 @@ Output:
         * Inset diagram: Hinged arm structure
 """
 import numpy as np
+import os
+import matplotlib
+
+INTERACTIVE = os.environ.get('MPL_INTERACTIVE') == '1'
+if not INTERACTIVE:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
 import pandas as pd
-import os
 from matplotlib.patches import FancyArrowPatch
 from mpl_toolkits.axes_grid1.inset_locator import inset_axes
 
@@ -46,10 +52,12 @@ plt.rcParams.update({
 
 def read_csv_files(file1, file2):
     """Read two CSV files"""
-    df1 = pd.read_csv(file1)
-    df2 = pd.read_csv(file2)
-    
-    return df1['time'].values, df1['U0'].values, df2['time'].values, df2['U0'].values
+    read_kwargs = dict(usecols=['time', 'U0'], dtype=float, engine='c')
+    df1 = pd.read_csv(file1, **read_kwargs)
+    df2 = pd.read_csv(file2, **read_kwargs)
+
+    return (df1['time'].to_numpy(copy=False), df1['U0'].to_numpy(copy=False),
+            df2['time'].to_numpy(copy=False), df2['U0'].to_numpy(copy=False))
 
 def plot_comparison(t1, u1, t2, u2, label1='BEM/regularized Stokeslet', label2='nonlocal slender body'):
     """Plot velocity comparison between two datasets"""
@@ -79,13 +87,16 @@ def add_inset_diagram(ax):
                       bbox_to_anchor=(0.38, -0.15, 0.83, 0.83), bbox_transform=ax.transAxes)
     axins.set_aspect('equal')
     axins.axis('off')
-    
+
     # Structure parameters
     theta = 0.6
     L = 3
     delta = 0.12
     offset = 5 * delta
-    
+    margin = 0.5
+    xlim = (-margin, L + offset + margin)
+    ylim = (-L - offset - margin, L + offset + margin)
+
     # Hinge positions
     P_upper = (offset, offset)
     P_lower = (offset, -offset)
@@ -120,8 +131,15 @@ def add_inset_diagram(ax):
     label_x = P_upper[0] + 2.3 * np.cos(theta/4)
     label_y = P_upper[1] + 2.3 * np.sin(theta/4)
     axins.text(label_x, label_y, r'$\theta(t)$', fontsize=fontsize-10, ha='center')
-    
-    # Coordinate system indicator
+
+    add_coordinate_indicator(ax)
+
+    # Set limits
+    axins.set_xlim(xlim)
+    axins.set_ylim(ylim)
+
+def add_coordinate_indicator(ax):
+    """Add small x-y coordinate system indicator"""
     coords_ax = ax.figure.add_axes([0.73, 0.22, 1/24, 1/18], frameon=False)
     coords_ax.arrow(0.08, 0.08, 0.15, 0, head_width=0.03, head_length=0.03,
                    linewidth=1.5, fc='k', ec='k')
@@ -130,11 +148,6 @@ def add_inset_diagram(ax):
     coords_ax.text(0.35, 0.04, '$x$', color='k', ha='center', fontsize=fontsize-14)
     coords_ax.text(0.08, 0.35, '$y$', color='k', ha='center', fontsize=fontsize-14)
     coords_ax.axis('off')
-    
-    # Set limits
-    margin = 0.5
-    axins.set_xlim(-margin, L + offset + margin)
-    axins.set_ylim(-L - offset - margin, L + offset + margin)
 
 def main():
     current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -150,8 +163,9 @@ def main():
     
     plt.tight_layout()
 
-    fig.savefig(output_file, format='png', dpi=300, bbox_inches='tight')    
-    plt.show()
+    fig.savefig(output_file, format='png', dpi=300, bbox_inches='tight')
+    if INTERACTIVE:
+        plt.show()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
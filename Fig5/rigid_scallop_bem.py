@@ -7,37 +7,116 @@ The model oscillates and does not generate a net swimming motion.
 Written by Xiaoping Hu and Shiyuan Hu <shiyuanhu@buaa.edu.cn>, Oct. 2025.
 """
 import numpy as np
-from scipy.linalg import solve
+from scipy.linalg import lu_factor, lu_solve
+from scipy.sparse.linalg import gmres, LinearOperator
 from gaussxw import gaussxw, rescale
 
+try:
+    from numba import njit, prange, guvectorize, float64
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def assemble_blocks(targets, sources, weights, nfine, delta, mirror, out):
+        """
+        Accumulate quadrature-weighted regularized Stokeslet blocks into out.
+        targets: (3,N); sources: (3,N*nfine); weights: (N*nfine,)
+        mirror: (3,) diagonal applied as a right-multiply on each 3x3 block
+        out: (3N, 3N), incremented in place
+        """
+        N = targets.shape[1]
+        delta2 = delta*delta
+        scale = 1.0/(8.0*np.pi)
+        for t in prange(N):
+            for j in range(N):
+                k00 = k01 = k02 = 0.0
+                k10 = k11 = k12 = 0.0
+                k20 = k21 = k22 = 0.0
+                for q in range(j*nfine, (j+1)*nfine):
+                    r0 = targets[0, t] - sources[0, q]
+                    r1 = targets[1, t] - sources[1, q]
+                    r2 = targets[2, t] - sources[2, q]
+                    rsq = r0*r0 + r1*r1 + r2*r2
+                    winv = weights[q]*scale/(rsq + delta2)**1.5
+                    diag = (rsq + 2.0*delta2)*winv
+                    k00 += diag + r0*r0*winv
+                    k01 += r0*r1*winv
+                    k02 += r0*r2*winv
+                    k10 += r1*r0*winv
+                    k11 += diag + r1*r1*winv
+                    k12 += r1*r2*winv
+                    k20 += r2*r0*winv
+                    k21 += r2*r1*winv
+                    k22 += diag + r2*r2*winv
+                out[3*t, 3*j] += k00*mirror[0]
+                out[3*t, 3*j+1] += k01*mirror[1]
+                out[3*t, 3*j+2] += k02*mirror[2]
+                out[3*t+1, 3*j] += k10*mirror[0]
+                out[3*t+1, 3*j+1] += k11*mirror[1]
+                out[3*t+1, 3*j+2] += k12*mirror[2]
+                out[3*t+2, 3*j] += k20*mirror[0]
+                out[3*t+2, 3*j+1] += k21*mirror[1]
+                out[3*t+2, 3*j+2] += k22*mirror[2]
+
+    # Batched 3x3 regularized Stokeslet blocks; the explicit signature
+    # makes numba compile eagerly at import time, so no warm-up call is
+    # needed before the first evaluation
+    @guvectorize([(float64[:], float64[:], float64, float64[:, :])],
+                 '(n),(n),()->(n,n)', target='parallel', fastmath=True,
+                 cache=True)
+    def stokeslet_gu(rsr, rtar, delta, G):
+        r0 = rtar[0] - rsr[0]
+        r1 = rtar[1] - rsr[1]
+        r2 = rtar[2] - rsr[2]
+        rsq = r0*r0 + r1*r1 + r2*r2
+        scale = 1.0/(8.0*np.pi)
+        inv_r3 = scale/(rsq + delta*delta)**1.5
+        diag = (rsq + 2.0*delta*delta)*inv_r3
+        G[0, 0] = diag + r0*r0*inv_r3
+        G[0, 1] = r0*r1*inv_r3
+        G[0, 2] = r0*r2*inv_r3
+        G[1, 0] = r1*r0*inv_r3
+        G[1, 1] = diag + r1*r1*inv_r3
+        G[1, 2] = r1*r2*inv_r3
+        G[2, 0] = r2*r0*inv_r3
+        G[2, 1] = r2*r1*inv_r3
+        G[2, 2] = diag + r2*r2*inv_r3
+
+# Shared 3x3 identity, allocated once for all kernel evaluations
+_I3 = np.eye(3)
+
 def stokeslet_reg(rsr, rtar, delta):
     """
     Regularized Stokeslet
     rsr: source position, (3,N)
     rtar: target point, (3,1)
     delta: regularization parameter
-    
+
     Return:
     G, (3,3,N)
     """
-    N = rsr.shape[1]
+    if njit is not None:
+        # (N,3) sources broadcast against the (1,3) target; the kernel
+        # fills one 3x3 block per pair on all cores
+        G = stokeslet_gu(np.ascontiguousarray(rsr.T),
+                         np.ascontiguousarray(rtar.T), delta)
+        return np.moveaxis(G, 0, 2)
 
     R = rtar - rsr # (3, N)
     Rsquare = np.sum(R**2, axis=0) # (N,)
-    Rabs_reg = np.sqrt(Rsquare + delta**2) # (N,)
+    inv_r3 = 1.0/(Rsquare + delta**2)**1.5 # (N,)
 
-    I = np.identity(3)
-    G = np.zeros((3,3,N))
-    for i in range(3):
-        for j in range(3):
-            G[i,j,:] = (Rsquare+2*delta**2)/Rabs_reg**3*I[i,j] + R[i,:]*R[j,:]/Rabs_reg**3
+    G = np.einsum('ij,k->ijk', _I3, (Rsquare + 2*delta**2)*inv_r3) \
+        + np.einsum('ik,jk->ijk', R, R)*inv_r3
 
     G = G/(8*np.pi)
 
     return G
 
 class TwoFilamentScallop:
-    def __init__(self, theta_A, theta_0, N, L, dt, T, tau, delta, nfine):
+    def __init__(self, theta_A, theta_0, N, L, dt, T, tau, delta, nfine,
+                 dtype=np.float64):
         # Physical parameters
         self.theta_A = theta_A # amplitude
         self.theta_0 = theta_0 # tilting angle
@@ -48,32 +127,72 @@ class TwoFilamentScallop:
         self.tau = tau # oscillation period
         self.delta = delta # regularization parameter
         self.nfine = nfine # number of Gauss–Legendre points
+        # Precision of the kernel assembly; pass np.float32 to halve the
+        # memory traffic of the N^2 interaction block. The linear solve is
+        # always carried out in double precision.
+        self.dtype = np.dtype(dtype)
         
         # arclength discretization
         self.ds = L / N
         self.s = np.linspace(-L/2, L/2, N+1)
         self.s_mid = (self.s[:-1] + self.s[1:]) / 2.0
+        self._s_mid_shifted = self.s_mid + L/2
         
         # Gaussian quadrature
         self.nodes, self.weights = gaussxw(nfine)
+
+        # Gauss point local coordinates and weights, fixed for all timesteps
+        self._ss_all = np.empty((N, nfine), dtype=self.dtype)
+        self._w_all = np.empty((N, nfine), dtype=self.dtype)
+        for j in range(N):
+            self._ss_all[j], self._w_all[j] = rescale(self.nodes, self.weights,
+                                                      self.s[j], self.s[j+1])
+        self._ss_all_shifted = self._ss_all + L/2
+        self._ss_shifted = self._ss_all_shifted.reshape(-1)
         
         # Filament arrays
-        self.r1 = np.zeros((N, 3))  # Upper filament positions
-        self.r2 = np.zeros((N, 3))  # Lower filament positions
-        
+        self.r1 = np.zeros((N, 3), dtype=self.dtype)  # Upper filament positions
+        self.r2 = np.zeros((N, 3), dtype=self.dtype)  # Lower filament positions
+
         # Hinged points
         self.x_hinge = 0.
-        self.r_hinge1 = np.array([self.x_hinge, 5*delta, 0.0])
-        self.r_hinge2 = np.array([self.x_hinge, -5*delta, 0.0])
-        
-        # System matrices
-        self.lhs = np.zeros((3*N+1, 3*N+1))
+        self.r_hinge1 = np.array([self.x_hinge, 5*delta, 0.0], dtype=self.dtype)
+        self.r_hinge2 = np.array([self.x_hinge, -5*delta, 0.0], dtype=self.dtype)
+
+        # System matrices; only the lhs assembly runs in self.dtype
+        self.lhs = np.zeros((3*N+1, 3*N+1), dtype=self.dtype)
         self.rhs = np.zeros(3*N+1)
+
+        # Interaction buffers for the NumPy fallback path, laid out as
+        # (N, 3, N, 3) blocks so the final copy into lhs is one reshape
+        if njit is None:
+            self._K = np.empty((N, 3, N, 3), dtype=self.dtype)
+            self._K_cross = np.empty((N, 3, N, 3), dtype=self.dtype)
+        self._init_static_lhs()
         
         self.t = 0.0
         self.U = 0.0
         self.U_p = 0.0
 
+        # Mirror symmetry transformation (diagonal of M_mirror) and the
+        # identity diagonal used for the self-interaction
+        self._mirror_diag = np.array([1.0, -1.0, 1.0])
+        self._no_mirror = np.ones(3)
+
+        # LU factorization reused as GMRES preconditioner between refactors
+        self._lu = None
+        self._steps_since_refactor = 0
+        self._refactor_every = 20
+        self._prev_x = None
+
+        # Warm the JIT so the first timestep doesn't pay compilation cost
+        if njit is not None:
+            assemble_blocks(np.zeros((3, 1), dtype=self.dtype),
+                            np.ones((3, 1), dtype=self.dtype),
+                            np.ones(1, dtype=self.dtype),
+                            1, delta, np.ones(3),
+                            np.zeros((3, 3), dtype=self.dtype))
+
         # Initialize geometry
         self.update_geometry()
 
@@ -85,78 +204,161 @@ class TwoFilamentScallop:
         self.theta2 = -self.theta1
         self.theta2_dot = -self.theta1_dot
         
+        # sin/cos of the orientation angles, computed once per step and
+        # reused by the tangent vectors and the RHS of the linear system;
+        # theta2 = -theta1 so its pair follows by symmetry
+        self._c1 = np.cos(self.theta1)
+        self._s1 = np.sin(self.theta1)
+        self._c2 = self._c1
+        self._s2 = -self._s1
+
         # tangent vectors
-        self.p1 = np.array([np.cos(self.theta1), np.sin(self.theta1), 0.0])
-        self.p2 = np.array([np.cos(self.theta2), np.sin(self.theta2), 0.0])
+        self.p1 = np.array([self._c1, self._s1, 0.0], dtype=self.dtype)
+        self.p2 = np.array([self._c2, self._s2, 0.0], dtype=self.dtype)
         
         # Update hinged positions
         self.r_hinge1[0] = self.x_hinge
         self.r_hinge2[0] = self.x_hinge
         
         # Update filament positions
-        for i in range(self.N):
-            self.r1[i] = self.r_hinge1 + (self.s_mid[i] + self.L/2) * self.p1
-            self.r2[i] = self.r_hinge2 + (self.s_mid[i] + self.L/2) * self.p2
+        s_col = self._s_mid_shifted[:, None]
+        np.multiply(s_col, self.p1, out=self.r1)
+        self.r1 += self.r_hinge1
+        np.multiply(s_col, self.p2, out=self.r2)
+        self.r2 += self.r_hinge2
 
     def get_gauss_points(self, element_idx, fila_id):
         """Get Gauss–Legendre points"""
-        s_start, s_end = self.s[element_idx], self.s[element_idx+1]
-        ss, w = rescale(self.nodes, self.weights, s_start, s_end)
-        
+        w = self._w_all[element_idx]
+
         if fila_id == 1:
             hinge = self.r_hinge1
             tang = self.p1
         else:
             hinge = self.r_hinge2
             tang = self.p2
-        
-        positions = np.zeros((3, self.nfine))
-        for k in range(self.nfine):
-            positions[:, k] = hinge + (ss[k] + self.L/2) * tang
-            
+
+        positions = hinge.reshape(3, 1) \
+            + self._ss_all_shifted[element_idx] * tang.reshape(3, 1)
+
         return positions, w
 
+    def _init_static_lhs(self):
+        """Set the constant border entries of the linear system once"""
+        # Translation velocity
+        self.lhs[0:3*self.N:3, 3*self.N] = -1.0
+        # Force-free condition
+        self.lhs[3*self.N, 0:3*self.N:3] = self.ds
+
+    def _build_all_gauss_points(self, fila_id):
+        """All Gauss–Legendre points of one filament, (3, N*nfine) and (N*nfine,)"""
+        if fila_id == 1:
+            hinge = self.r_hinge1
+            tang = self.p1
+        else:
+            hinge = self.r_hinge2
+            tang = self.p2
+        positions = hinge.reshape(3, 1) + self._ss_shifted * tang.reshape(3, 1)
+        return positions, self._w_all.reshape(-1)
+
+    def _weighted_stokeslet_block(self, targets, sources, weights, out=None):
+        """
+        Quadrature-weighted regularized Stokeslet interactions of all targets
+        with all source Gauss points, reduced per element.
+        targets: (3, N); sources: (3, N*nfine); weights: (N*nfine,)
+        out: optional (N, 3, N, 3) buffer, filled in place when given
+
+        Return:
+        K, (N, 3, N, 3) such that K[i, :, j, :] is the 3x3 velocity block
+        induced at target i by the force on element j
+        """
+        N, nfine = self.N, self.nfine
+        R = targets[:, :, None] - sources[:, None, :] # (3, N, N*nfine)
+        Rsquare = np.sum(R*R, axis=0) # (N, N*nfine)
+        w_inv_r3 = weights/(Rsquare + self.delta**2)**1.5
+
+        R = R.reshape(3, N, N, nfine)
+        K = np.einsum('atjq,btjq,tjq->tajb', R, R,
+                      w_inv_r3.reshape(N, N, nfine), out=out)
+
+        # Isotropic part, reduced over each element's Gauss points
+        diag = ((Rsquare + 2*self.delta**2)*w_inv_r3).reshape(N, N, nfine).sum(axis=2)
+        K[:, 0, :, 0] += diag
+        K[:, 1, :, 1] += diag
+        K[:, 2, :, 2] += diag
+
+        K *= 1.0/(8*np.pi)
+        return K
+
     def form_linear_system(self):
         """Construct linear system for BEM"""
-        self.lhs.fill(0)
-        self.rhs.fill(0)
-        
-        # Mirror symmetry transformation
-        M_mirror = np.diag([1.0, -1.0, 1.0])
-        
-        # Form hydrodynamic interactions
-        for i in range(self.N):
-            target_pos = self.r1[i].reshape(3, 1)
-            
+        # Form hydrodynamic interactions in one batched evaluation per filament
+        targets = self.r1.T
+        sources1, weights1 = self._build_all_gauss_points(1)
+        # Filament 2 is the exact mirror image of filament 1, so its Gauss
+        # points follow from a y sign flip instead of a second construction
+        sources2 = sources1.copy()
+        sources2[1] *= -1.0
+        weights2 = weights1
+
+        if njit is not None:
+            # Only the interaction block needs clearing: the kernel
+            # accumulates into it, while the border row and column set in
+            # _init_static_lhs are left untouched
+            block = self.lhs[:3*self.N, :3*self.N]
+            block.fill(0)
             # Self-interaction: filament 1 on itself
-            for j in range(self.N):
-                source_pos, weights = self.get_gauss_points(j, 1)
-                G = stokeslet_reg(source_pos, target_pos, self.delta)
-                self.lhs[3*i:3*i+3, 3*j:3*j+3] += np.sum(G * weights, axis=2)
-            
-            # Cross-interaction: filament 2 on filament 1
-            for j in range(self.N):
-                source_pos, weights = self.get_gauss_points(j, 2)
-                G = stokeslet_reg(source_pos, target_pos, self.delta)
-                self.lhs[3*i:3*i+3, 3*j:3*j+3] += np.sum(G * weights, axis=2) @ M_mirror
-            
-            # Prescribed rotational velocity
-            v_rot = (self.s_mid[i] + self.L/2) * self.theta1_dot
-            self.rhs[3*i] = v_rot * (-np.sin(self.theta1))
-            self.rhs[3*i+1] = v_rot * np.cos(self.theta1)
-            self.rhs[3*i+2] = 0.0
-        
-        # Translation velocity
-        for i in range(self.N):
-            self.lhs[3*i, 3*self.N] = -1.0
+            assemble_blocks(targets, sources1, weights1, self.nfine,
+                            self.delta, self._no_mirror, block)
+            # Cross-interaction: filament 2 on filament 1, with the mirror
+            # transformation applied as a right-multiply on every 3x3 block
+            assemble_blocks(targets, sources2, weights2, self.nfine,
+                            self.delta, self._mirror_diag, block)
+        else:
+            # Self-interaction: filament 1 on itself
+            K = self._weighted_stokeslet_block(targets, sources1, weights1,
+                                               out=self._K)
+            # Cross-interaction: filament 2 on filament 1, with the mirror
+            # transformation applied as a right-multiply on every 3x3 block
+            K_cross = self._weighted_stokeslet_block(targets, sources2,
+                                                     weights2, out=self._K_cross)
+            K_cross *= self._mirror_diag
+            K += K_cross
+            # Plain assignment, so no zeroing of the block is needed
+            self.lhs[:3*self.N, :3*self.N] = K.reshape(3*self.N, 3*self.N)
 
-        # Force-free condition
-        for i in range(self.N):
-            self.lhs[3*self.N, 3*i] = self.ds
+        # Prescribed rotational velocity, in two strided assignments; the
+        # z components and the closing row stay zero from allocation
+        v_rot = self._s_mid_shifted * self.theta1_dot
+        self.rhs[0:3*self.N:3] = -self._s1 * v_rot
+        self.rhs[1:3*self.N:3] = self._c1 * v_rot
+
+    def _solve_direct(self):
+        """Refactorize and solve directly, promoted to double precision"""
+        self._lu = lu_factor(self.lhs.astype(np.float64, copy=False),
+                             check_finite=False)
+        self._steps_since_refactor = 0
+        return lu_solve(self._lu, self.rhs, check_finite=False)
 
     def solve_system(self):
         """Solve linear system"""
-        results = solve(self.lhs, self.rhs)
+        if self._lu is None or self._steps_since_refactor >= self._refactor_every:
+            results = self._solve_direct()
+        else:
+            # The geometry varies smoothly between steps, so the previous LU
+            # factorization is an excellent preconditioner and the previous
+            # solution a good initial guess
+            n = self.lhs.shape[0]
+            precond = LinearOperator((n, n), matvec=lambda b: lu_solve(
+                self._lu, b, check_finite=False))
+            results, info = gmres(self.lhs.astype(np.float64, copy=False),
+                                  self.rhs, x0=self._prev_x,
+                                  rtol=1e-10, atol=0.0, M=precond)
+            if info != 0:
+                results = self._solve_direct()
+        self._steps_since_refactor += 1
+        self._prev_x = results
+
         self.U = results[3*self.N]
         
         # Update hinged position
@@ -173,19 +375,28 @@ class TwoFilamentScallop:
     def simulate(self, filename="scallop_results.txt", savedata=True):
         """Run complete simulation"""
         if savedata:
-            fileobj = open(filename, "w")
-        
+            fileobj = open(filename, "w", buffering=1<<20)
+
+        # Buffer output lines and write them in batches; flushing every
+        # step serializes the time loop on syscalls
+        buf = []
+        step_count = 0
         while self.t < self.T:
-            print("{:.3f}".format(self.t))
+            if step_count % 50 == 0:
+                print("{:.3f}".format(self.t))
             self.step()
-            
+
             if savedata:
-                fileobj.write("{:.5f} {:.10f} {:.10f}\n".format(self.t, self.U, self.x_hinge))
-                fileobj.flush()
-            
+                buf.append("{:.5f} {:.10f} {:.10f}\n".format(self.t, self.U, self.x_hinge))
+                if len(buf) >= 100:
+                    fileobj.writelines(buf)
+                    buf.clear()
+
             self.t += self.dt
-        
+            step_count += 1
+
         if savedata:
+            fileobj.writelines(buf)
             fileobj.close()
             print(f"Results saved to {filename}")
 
@@ -0,0 +1,64 @@
+"""
+Regenerate all figure panels in a single Python process.
+
+Running each FigN script separately re-imports Matplotlib and re-launches
+the LaTeX toolchain for every panel; executing them from one process
+amortizes that startup cost across the whole set. Individual scripts can
+still be run on their own as before.
+
+Usage:
+    python build_all.py            # build every panel
+    python build_all.py Fig2a Fig5 # build selected panels only
+"""
+import os
+import runpy
+import sys
+import traceback
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+SCRIPTS = [
+    'Fig1/Fig1a.py',
+    'Fig1/Fig1b.py',
+    'Fig2/Fig2a.py',
+    'Fig2/Fig2b.py',
+    'Fig3/Fig3a.py',
+    'Fig3/Fig3b.py',
+    'Fig4/Fig4b.py',
+    'Fig4/Fig4c.py',
+    'Fig5/Fig5.py',
+    'Fig6/Fig6a.py',
+    'Fig6/Fig6b.py',
+    'Fig6/Fig6c.py',
+]
+
+def main(argv=None):
+    selected = set(sys.argv[1:] if argv is None else argv)
+    failed = []
+    for rel_path in SCRIPTS:
+        name = os.path.splitext(os.path.basename(rel_path))[0]
+        if selected and name not in selected:
+            continue
+        print(f"Building {name} ...")
+        sys.path.insert(0, os.path.join(ROOT, os.path.dirname(rel_path)))
+        try:
+            # Each script mutates rcParams for its own style; rc_context
+            # restores them so one panel's settings don't leak into the next
+            with matplotlib.rc_context():
+                runpy.run_path(os.path.join(ROOT, rel_path), run_name='__main__')
+        except Exception:
+            traceback.print_exc()
+            failed.append(name)
+        finally:
+            sys.path.pop(0)
+            plt.close('all')
+    if failed:
+        print(f"Failed: {', '.join(failed)}")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())